@@ -25,13 +25,20 @@
 #          > reprend la précédente et ajoute :
 #              – un bonus proportionnel au nombre de coups encore jouables ;
 #              – un bonus/malus pour les positions de “double-menace” (fourches).
+#  Elles acceptent une partie (MorpionUltime) ou un FastState ; la recherche
+#  appelle directement leurs variantes _evaluer_* réservées au FastState.
 #
 #  Toutes les méthodes retournant un coup renvoient un quadruplet :
 #      (sousPlateau_ligne, sousPlateau_colonne, cellule_ligne, cellule_colonne)
 # -----------------------------------------------------------------------------
 
 import random
-import math
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from game import WIN_MASKS, POPCOUNT, GRILLE_PLEINE, SUBBOARD_SHIFT, PLATEAU_LIBRE, COUPS
+
+INF = 1_000_000_000     # « Infini » entier : borne initiale des recherches minimax
 
 # =============================================================================
 # Classe de base — attributs et utilitaires communs à toutes les IA
@@ -54,14 +61,20 @@ class IA:
         Compteur de nœuds évalués lors du dernier appel à `get_move`.
     score_dernier_coup : float | None
         Score heuristique du coup choisi lors du dernier appel à `get_move`.
+    nb_processus : int
+        Nombre de processus entre lesquels répartir les coups racine
+        (1 = recherche séquentielle ; utile surtout à grande profondeur).
     """
 
+    nom = "IA de Base"      # Nom par défaut : attribut de classe, lisible sans instance
+
     def __init__(self, joueur):
         self.joueur             = joueur                                 # Symbole IA
         self.adversaire         = 'O' if joueur == 'X' else 'X'          # Symbole adv.
-        self.nom                = "IA de Base"                           # Nom par défaut
         self.coups_evalues      = 0                                        # Compteur reset
         self.score_dernier_coup = None                                     # Score du dernier coup
+        self.nb_processus       = 1                                        # Recherche séquentielle
+        self._executeur         = None                                     # Créé au premier besoin
 
     # -----------------------------------------------------------------
     # Méthodes d’interface
@@ -69,140 +82,314 @@ class IA:
     def obtenir_coups_valides(self, partie):
         """Renvoie la liste des coups légaux pour l’état `partie` fourni.
         
-        Délègue simplement à l’objet `partie` (instance de MorpionUltime)."""
+        Délègue simplement à l’objet `partie` (MorpionUltime ou FastState)."""
         return partie.obtenir_coups_valides()
 
+    def executeur(self):
+        """ProcessPoolExecutor réutilisé d’un appel à `get_move` à l’autre."""
+        if self._executeur is None:
+            self._executeur = ProcessPoolExecutor(max_workers=self.nb_processus)
+        return self._executeur
+
 
 # =============================================================================
 # Heuristique de base — Sert à IAFacile & IAMoyenne
 # =============================================================================
-def evaluer_ligne(ligne, joueur):
-    """Attribue un score à une ligne / colonne / diagonale.
-    L’idée : plus il y a de symboles « joueur » alignés sans blocage adverse,
-    plus la valeur augmente exponentiellement (10ⁿ).
-    Inversement, si la ligne appartient à l’adversaire, la valeur est négative.
-    Si les deux symboles sont présents, la ligne est “bloquée” → 0."""
-    adversaire = 'O' if joueur == 'X' else 'X'
-    if joueur in ligne and adversaire in ligne:      # Ligne mixte → bloquée
-        return 0
-    if joueur in ligne:                              # Ligne à notre avantage
-        return 10 ** ligne.count(joueur)
-    if adversaire in ligne:                          # Ligne à l’adversaire
-        return -(10 ** ligne.count(adversaire))
-    return 0                                         # Ligne vide (neutre)
+# Score d’une ligne / colonne / diagonale, selon le nombre de symboles de
+# chaque camp qu’elle contient.
+# L’idée : plus il y a de symboles « joueur » alignés sans blocage adverse,
+# plus la valeur augmente exponentiellement (10ⁿ).
+# Inversement, si la ligne appartient à l’adversaire, la valeur est négative.
+# Si les deux symboles sont présents, la ligne est “bloquée” → 0.
+#
+# Index : (nb_joueur << 2) | nb_adversaire  (16 entrées)
+LINE_SCORES = tuple(
+    0 if nj and na else 10 ** nj if nj else -(10 ** na) if na else 0
+    for nj in range(4) for na in range(4)
+)
+# Même table pour le plateau global des sous-plateaux gagnés (poids ×10)
+META_LINE_SCORES = tuple(10 * sc for sc in LINE_SCORES)
+
+CENTRE = 1 << 4     # Bit de la case centrale (1, 1)
 
 
-def evaluer_sous_plateau(plateau, joueur):
-    """Score d’un PetitPlateau non fini (contrôle centre + alignements)."""
+def evaluer_sous_plateau(bb_j, bb_adv):
+    """Score d’un sous-plateau non fini (contrôle centre + alignements),
+    donné par les bitboards 9 bits du joueur et de son adversaire."""
     score = 0
     # Contrôle du centre : très important dans le morpion ----------------
-    if plateau.plateau[1][1] == joueur:
+    if bb_j & CENTRE:
         score += 20
-    elif plateau.plateau[1][1] == ('O' if joueur == 'X' else 'X'):
+    elif bb_adv & CENTRE:
         score -= 20
-    # Parcourt les 3 lignes horizontales ---------------------------------
-    for r in range(3):
-        score += evaluer_ligne(plateau.plateau[r], joueur)
-    # Parcourt les 3 lignes verticales -----------------------------------
-    for c in range(3):
-        colonne = [plateau.plateau[r][c] for r in range(3)]
-        score += evaluer_ligne(colonne, joueur)
-    # Ajoute les 2 diagonales --------------------------------------------
-    diag1 = [plateau.plateau[i][i]   for i in range(3)]
-    diag2 = [plateau.plateau[i][2-i] for i in range(3)]
-    score += evaluer_ligne(diag1, joueur)
-    score += evaluer_ligne(diag2, joueur)
+    # 3 lignes, 3 colonnes, 2 diagonales : une table par alignement ------
+    for m in WIN_MASKS:
+        score += LINE_SCORES[(POPCOUNT[bb_j & m] << 2) | POPCOUNT[bb_adv & m]]
     return score
 
 
-def evaluer_ultime(partie, joueur):
-    """Heuristique globale — mixe :
+def paires_valides():
+    """Toutes les paires (bb_j, bb_adv) de grilles 9 bits disjointes (3⁹ = 19683)."""
+    for bb_j in range(GRILLE_PLEINE + 1):
+        libres = GRILLE_PLEINE & ~bb_j
+        bb_adv = libres
+        while True:                              # Sous-ensembles de `libres`
+            yield bb_j, bb_adv
+            if not bb_adv:
+                break
+            bb_adv = (bb_adv - 1) & libres
+
+
+def table_paires(fonction):
+    """Précalcule fonction(bb_j, bb_adv) pour toutes les paires valides.
+    La table (liste de 2¹⁸ entrées) s’indexe par (bb_j << 9) | bb_adv."""
+    table = [0] * (1 << 18)
+    for bb_j, bb_adv in paires_valides():
+        table[(bb_j << 9) | bb_adv] = fonction(bb_j, bb_adv)
+    return table
+
+
+# evaluer_sous_plateau pour chacune des 3⁹ grilles possibles : une seule
+# lecture de table par sous-plateau au lieu de 8 alignements.
+SCORES_SOUS_PLATEAU = table_paires(evaluer_sous_plateau)
+
+
+def _score_meta(won_j, won_adv):
+    """Part de evaluer_ultime due aux seuls sous-plateaux gagnés : ±10000
+    par plateau, plus les alignements du plateau global (poids ×10)."""
+    score = 10000 * (POPCOUNT[won_j] - POPCOUNT[won_adv])
+    for m in WIN_MASKS:
+        score += META_LINE_SCORES[(POPCOUNT[won_j & m] << 2) | POPCOUNT[won_adv & m]]
+    return score
+
+
+# Idem pour le plateau global, indexé par (won_j << 9) | won_adv
+SCORES_META = table_paires(_score_meta)
+
+
+def bitboards_joueur(etat, joueur):
+    """(bb_j, bb_adv, won_j, won_adv) d’un FastState, vus depuis `joueur`."""
+    if joueur == 'X':
+        return etat.bb_x, etat.bb_o, etat.won_x, etat.won_o
+    return etat.bb_o, etat.bb_x, etat.won_o, etat.won_x
+
+
+def _evaluer_ultime(etat, joueur):
+    """Heuristique globale d’un FastState — mixe :
        1) plaques déjà gagnées/perdues  2) état interne des autres plaques."""
-    adversaire = 'O' if joueur == 'X' else 'X'
-    score = 0
-    # 1. Parcourt les 9 sous-plateaux et gère ceux déjà décidés ----------
-    for i in range(3):
-        for j in range(3):
-            sp = partie.plateaux[i][j]
-            if sp.vainqueur == joueur:
-                score += 10000                   # Grosse récompense
-            elif sp.vainqueur == adversaire:
-                score -= 10000                   # Grosse pénalité
-            else:
-                score += evaluer_sous_plateau(sp, joueur)
-    # 2. Convertit en plateau global virtuel et réévalue ----------------
-    pg = [[' ' for _ in range(3)] for _ in range(3)]
-    for i in range(3):
-        for j in range(3):
-            w = partie.plateaux[i][j].vainqueur
-            pg[i][j] = w if w and w != 'DRAW' else ' '
-    for r in range(3):
-        score += evaluer_ligne(pg[r], joueur) * 10
-    for c in range(3):
-        score += evaluer_ligne([pg[r][c] for r in range(3)], joueur) * 10
-    diag1 = [pg[i][i]   for i in range(3)]
-    diag2 = [pg[i][2-i] for i in range(3)]
-    score += evaluer_ligne(diag1, joueur) * 10
-    score += evaluer_ligne(diag2, joueur) * 10
+    bb_j, bb_adv, won_j, won_adv = bitboards_joueur(etat, joueur)
+    # 1. Sous-plateaux déjà gagnés/perdus + plateau global : une lecture --
+    score = SCORES_META[(won_j << 9) | won_adv]
+    # 2. Ajoute l’état interne des sous-plateaux non gagnés --------------
+    gagnes = won_j | won_adv
+    for p in range(9):
+        if not (gagnes >> p) & 1:
+            score += SCORES_SOUS_PLATEAU[(((bb_j >> 9 * p) & GRILLE_PLEINE) << 9) |
+                                         ((bb_adv >> 9 * p) & GRILLE_PLEINE)]
     return score
 
 
+def evaluer_ultime(partie, joueur):
+    """Heuristique globale d’une partie (MorpionUltime ou FastState)."""
+    return _evaluer_ultime(partie.vers_etat_rapide(), joueur)
+
+
 # =============================================================================
 # Heuristique avancée (Version Difficile) — ajoute mobilité & fourches
 # =============================================================================
-def evaluer_difficile(partie, joueur):
-    """Version améliorée :
+def _score_fourches(bb_j, bb_adv):
+    """±300 par « fourche » (au moins deux menaces immédiates : 2 symboles
+    + 1 case vide) du joueur ou de l’adversaire dans un sous-plateau."""
+    men_joueur = men_adv = 0
+    for m in WIN_MASKS:
+        if POPCOUNT[bb_j & m] == 2 and not bb_adv & m:
+            men_joueur += 1
+        if POPCOUNT[bb_adv & m] == 2 and not bb_j & m:
+            men_adv += 1
+    # Deux menaces distinctes = fourche
+    return (300 if men_joueur >= 2 else 0) - (300 if men_adv >= 2 else 0)
+
+
+# Score complet d’un sous-plateau pour la version difficile : alignements
+# (SCORES_SOUS_PLATEAU) + fourches, toujours indexé par (bb_j << 9) | bb_adv.
+SCORES_FOURCHES = table_paires(_score_fourches)
+SCORES_SOUS_PLATEAU_DIFFICILE = [a + b for a, b in zip(SCORES_SOUS_PLATEAU, SCORES_FOURCHES)]
+
+
+def _evaluer_difficile(etat, joueur):
+    """Version améliorée (FastState) :
        • reprend evaluer_ultime
        • ajoute un petit bonus pour le nombre de coups disponibles
-       • détecte les « fourches » (double-menace dans un sous-plateau)."""
-    adversaire = 'O' if joueur == 'X' else 'X'
-    score = evaluer_ultime(partie, joueur)                    # Base héritée
-    score += len(partie.obtenir_coups_valides())              # Mobilité
-    # Boucle sur sous-plateaux non terminés -------------------------
-    for i in range(3):
-        for j in range(3):
-            sp = partie.plateaux[i][j]
-            if sp.jeu_termine:
-                continue
-            men_joueur = men_adv = 0
-            lignes = []
-            lignes.extend(sp.plateau)                             # 3 lignes
-            lignes.extend([[sp.plateau[r][c] for r in range(3)]   # 3 colonnes
-                           for c in range(3)])
-            lignes.append([sp.plateau[k][k]   for k in range(3)]) # diag \
-            lignes.append([sp.plateau[k][2-k] for k in range(3)]) # diag /
-            # Comptage des menaces immédiates ----------------------
-            for ligne in lignes:
-                if ligne.count(joueur) == 2 and ligne.count(' ') == 1:
-                    men_joueur += 1
-                if ligne.count(adversaire) == 2 and ligne.count(' ') == 1:
-                    men_adv += 1
-            if men_joueur >= 2:   # Deux menaces distinctes = fourche
-                score += 300
-            if men_adv >= 2:
-                score -= 300
+       • détecte les « fourches » (double-menace dans un sous-plateau).
+    Les fourches sont lues dans la même table que le reste du sous-plateau :
+    une seule lecture par sous-plateau non gagné (un plateau nul est plein,
+    donc sans menace)."""
+    bb_j, bb_adv, won_j, won_adv = bitboards_joueur(etat, joueur)
+    score = SCORES_META[(won_j << 9) | won_adv]                  # Base héritée
+    score += bin(etat.legal_mask).count('1')                    # Mobilité
+    gagnes = won_j | won_adv
+    for p in range(9):
+        if not (gagnes >> p) & 1:
+            score += SCORES_SOUS_PLATEAU_DIFFICILE[(((bb_j >> 9 * p) & GRILLE_PLEINE) << 9) |
+                                                   ((bb_adv >> 9 * p) & GRILLE_PLEINE)]
     return score
 
 
+def evaluer_difficile(partie, joueur):
+    """Heuristique avancée d’une partie (MorpionUltime ou FastState)."""
+    return _evaluer_difficile(partie.vers_etat_rapide(), joueur)
+
+
+# =============================================================================
+# Table de transposition — mémorise les positions déjà recherchées
+# =============================================================================
+EXACT, LOWER, UPPER = 0, 1, 2   # Valeur exacte / borne inférieure / borne supérieure
+ZOB_VUE_O = 0x9E3779B97F4A7C15  # XOR sur le hash quand l’IA évalue pour 'O'
+
+
+class TableTransposition:
+    """Table à adressage direct indexée par hash de Zobrist.
+
+    Chaque case contient (hash, profondeur_restante, valeur, drapeau, meilleur_coup).
+    En cas de collision, une entrée n’est remplacée que par une recherche au
+    moins aussi profonde."""
+
+    def __init__(self, taille=1 << 20):
+        self.masque  = taille - 1                 # `taille` doit être une puissance de 2
+        self.entrees = [None] * taille
+
+    def sonder(self, h):
+        """Renvoie l’entrée du hash `h`, ou None si elle est absente."""
+        entree = self.entrees[h & self.masque]
+        if entree is not None and entree[0] == h:
+            return entree
+        return None
+
+    def stocker(self, h, profondeur, valeur, drapeau, coup):
+        i = h & self.masque
+        ancienne = self.entrees[i]
+        if ancienne is None or profondeur >= ancienne[1]:
+            self.entrees[i] = (h, profondeur, valeur, drapeau, coup)
+
+
+class CacheRacine:
+    """Coups racine pré-triés, à adressage direct comme TableTransposition :
+    (hash, coups) par case, la dernière position stockée écrasant l’ancienne.
+    La taille reste bornée même partagée sur tout un tournoi."""
+
+    def __init__(self, taille=1 << 12):
+        self.masque  = taille - 1                 # `taille` doit être une puissance de 2
+        self.entrees = [None] * taille
+
+    def sonder(self, h):
+        """Renvoie les coups triés du hash `h`, ou None s’ils sont absents."""
+        entree = self.entrees[h & self.masque]
+        if entree is not None and entree[0] == h:
+            return entree[1]
+        return None
+
+    def stocker(self, h, coups):
+        self.entrees[h & self.masque] = (h, coups)
+
+
+# =============================================================================
+# Ordonnancement des coups — l’élagage alpha-beta coupe d’autant plus tôt
+# que le meilleur coup est essayé en premier
+# =============================================================================
+# COUPS_GAGNANTS[grille] = bitboard des cases qui complètent un alignement
+# pour le joueur possédant `grille` (512 entrées).
+COUPS_GAGNANTS = tuple(
+    sum(1 << c for c in range(9)
+        if not (g >> c) & 1 and any((g | 1 << c) & m == m for m in WIN_MASKS))
+    for g in range(GRILLE_PLEINE + 1)
+)
+
+
+def ordonner_coups(etat, coup_tt=None):
+    """Coups légaux de `etat`, du plus prometteur au moins prometteur :
+       1) le meilleur coup mémorisé dans la table de transposition ;
+       2) les coups qui gagnent un sous-plateau ;
+       3) la case centrale d’un sous-plateau, puis le sous-plateau central ;
+       4) le reste, dans l’ordre habituel."""
+    bb = etat.bb_o if etat.current else etat.bb_x
+
+    def priorite(mv):
+        sp_l, sp_c, cel_l, cel_c = mv
+        score = 0
+        if mv == coup_tt:
+            score += 1000000
+        if (COUPS_GAGNANTS[(bb >> SUBBOARD_SHIFT[sp_l][sp_c]) & GRILLE_PLEINE] >> (3 * cel_l + cel_c)) & 1:
+            score += 10000
+        if cel_l == 1 and cel_c == 1:
+            score += 100
+        if sp_l == 1 and sp_c == 1:
+            score += 50
+        return score
+
+    return sorted(etat.obtenir_coups_valides(), key=priorite, reverse=True)   # Tri stable
+
+
 # =============================================================================
 # IAFacile — évalue chaque coup sur une profondeur de 1
 # =============================================================================
+def evaluer_enfants(etat, joueur):
+    """evaluer_ultime de tous les états fils de `etat`, en une passe :
+    liste de (coup, score) dans l’ordre de etat.obtenir_coups_valides().
+
+    Un coup ne modifie qu’un sous-plateau : les 9 contributions du parent sont
+    lues une fois, puis chaque fils ne relit que la table de son sous-plateau
+    (ou celle du plateau global s’il le gagne), sans construire de FastState."""
+    bb_j, bb_adv, won_j, won_adv = bitboards_joueur(etat, joueur)
+    gagnes = won_j | won_adv
+    grilles_j   = [(bb_j   >> 9 * p) & GRILLE_PLEINE for p in range(9)]
+    grilles_adv = [(bb_adv >> 9 * p) & GRILLE_PLEINE for p in range(9)]
+    parts = [0 if (gagnes >> p) & 1 else SCORES_SOUS_PLATEAU[(grilles_j[p] << 9) | grilles_adv[p]]
+             for p in range(9)]
+    total = sum(parts)
+    meta  = SCORES_META[(won_j << 9) | won_adv]
+    trait_joueur = (etat.current == 0) == (joueur == 'X')    # Qui pose le symbole ?
+    resultats = []
+    legaux = etat.legal_mask
+    while legaux:                                   # Même ordre que obtenir_coups_valides
+        bit     = legaux & -legaux
+        legaux ^= bit
+        k       = bit.bit_length() - 1
+        p, c    = divmod(k, 9)
+        g_j, g_adv = grilles_j[p], grilles_adv[p]
+        if trait_joueur:
+            gagne = (COUPS_GAGNANTS[g_j] >> c) & 1
+            g_j  |= 1 << c
+        else:
+            gagne = (COUPS_GAGNANTS[g_adv] >> c) & 1
+            g_adv |= 1 << c
+        if gagne:                                   # Sous-plateau conquis : seul le global change
+            if trait_joueur:
+                sc = SCORES_META[((won_j | 1 << p) << 9) | won_adv]
+            else:
+                sc = SCORES_META[(won_j << 9) | won_adv | 1 << p]
+            sc += total - parts[p]
+        else:
+            sc = meta + total - parts[p] + SCORES_SOUS_PLATEAU[(g_j << 9) | g_adv]
+        resultats.append((COUPS[k], sc))
+    return resultats
+
+
 class IAFacile(IA):
+    nom = "IA Facile"
+
     def __init__(self, joueur):
         super().__init__(joueur)
-        self.nom            = "IA Facile"
         self.profondeur_max = 1  # Profondeur maximale (non utilisée ici)
 
     def get_move(self, partie):
         """Teste tous les coups et renvoie celui au meilleur score heuristique."""
+        etat = partie.vers_etat_rapide()                  # Simulation sur FastState
         # self.coups_evalues = 0  # Statistiques désactivées
-        meilleur_score     = -math.inf
+        meilleur_score     = -INF
         meilleur_coup      = None
-        # Boucle d’évaluation brute ---------------------------------------
-        for mv in self.obtenir_coups_valides(partie):
-            clone = partie.dupliquer(); clone.jouer_coup(*mv)
+        # Évaluation de tous les fils en une passe ------------------------
+        for mv, sc in evaluer_enfants(etat, self.joueur):
             # self.coups_evalues += 1                          # Statistiques
-            sc = evaluer_ultime(clone, self.joueur)
             if sc > meilleur_score:
                 meilleur_score, meilleur_coup = sc, mv
         self.score_dernier_coup = meilleur_score
@@ -212,12 +399,35 @@ class IAFacile(IA):
 # =============================================================================
 # IAMoyenne — Minimax sans élagage, profondeur 3, avec erreurs possibles
 # =============================================================================
+def _minimax_simple(etat, restant, est_max, joueur):
+    """Minimax récursif (sans alpha-beta), en fonction libre : appelable
+    depuis un processus de calcul."""
+    if etat.jeu_termine or restant == 0:
+        return _evaluer_ultime(etat, joueur)
+    if est_max:
+        meilleur = -INF
+        for mv in etat.obtenir_coups_valides():
+            sc = _minimax_simple(etat.jouer_coup(*mv), restant-1, False, joueur)
+            if sc > meilleur:
+                meilleur = sc
+        return meilleur
+    else:
+        pire = INF
+        for mv in etat.obtenir_coups_valides():
+            sc = _minimax_simple(etat.jouer_coup(*mv), restant-1, True, joueur)
+            if sc < pire:
+                pire = sc
+        return pire
+
+
 class IAMoyenne(IA):
+    nom = "IA Moyenne"
+
     def __init__(self, joueur):
         super().__init__(joueur)
-        self.nom                      = "IA Moyenne"
         self.profondeur_max          = 3
         self.taux_erreur_strategique = 0.3  # 30 % de coups “aléatoires”
+        self.rapporter_score         = False  # Évaluer aussi les coups aléatoires ?
 
     # -----------------------------------------------------------------
     # Minimax récursif (sans alpha-beta)
@@ -225,51 +435,172 @@ class IAMoyenne(IA):
     def minimax(self, partie, profondeur, est_max):
         """Retourne la valeur minimax du nœud `partie` (récursion)."""
         # self.coups_evalues += 1
-        if partie.jeu_termine or profondeur == self.profondeur_max:
-            return evaluer_ultime(partie, self.joueur)
-        if est_max:
-            meilleur = -math.inf
-            for mv in partie.obtenir_coups_valides():
-                clone = partie.dupliquer(); clone.jouer_coup(*mv)
-                meilleur = max(meilleur, self.minimax(clone, profondeur+1, False))
-            return meilleur
-        else:
-            pire = math.inf
-            for mv in partie.obtenir_coups_valides():
-                clone = partie.dupliquer(); clone.jouer_coup(*mv)
-                pire = min(pire, self.minimax(clone, profondeur+1, True))
-            return pire
+        return _minimax_simple(partie.vers_etat_rapide(), self.profondeur_max - profondeur, est_max, self.joueur)
 
     def get_move(self, partie):
         """Renvoie le meilleur coup, ou un coup aléatoire selon le taux d’erreur."""
+        etat = partie.vers_etat_rapide()                  # Simulation sur FastState
         # self.coups_evalues = 0
+        coups = self.obtenir_coups_valides(etat)
         # Introduit de l’aléa pour simuler des erreurs stratégiques ------
         if random.random() < self.taux_erreur_strategique:
-            mv = random.choice(self.obtenir_coups_valides(partie))
-            clone = partie.dupliquer(); clone.jouer_coup(*mv)
-            self.score_dernier_coup = evaluer_ultime(clone, self.joueur)
+            mv = random.choice(coups)
+            # Le score n’est calculé que si l’appelant le demande (statistiques)
+            self.score_dernier_coup = _evaluer_ultime(etat.jouer_coup(*mv), self.joueur) \
+                if self.rapporter_score else None
             return mv
-        meilleur_score = -math.inf
-        meilleurs      = []
-        for mv in self.obtenir_coups_valides(partie):
-            clone = partie.dupliquer(); clone.jouer_coup(*mv)
-            sc = self.minimax(clone, 1, False)               # Prochaine couche = “min”
+        enfants = [etat.jouer_coup(*mv) for mv in coups]
+        if self.nb_processus > 1:
+            # Sous-arbres racine indépendants : un par tâche
+            valeur = partial(_minimax_simple, restant=self.profondeur_max - 1,
+                             est_max=False, joueur=self.joueur)
+            scores = list(self.executeur().map(valeur, enfants))
+        else:
+            scores = [self.minimax(enfant, 1, False) for enfant in enfants]   # Prochaine couche = “min”
+        # Départage aléatoire uniforme des ex æquo, sans liste (« réservoir »)
+        meilleur_score, meilleur_coup, nb_ex_aequo = -INF, None, 0
+        for mv, sc in zip(coups, scores):
             if sc > meilleur_score:
-                meilleur_score, meilleurs = sc, [mv]
+                meilleur_score, meilleur_coup, nb_ex_aequo = sc, mv, 1
             elif sc == meilleur_score:
-                meilleurs.append(mv)
+                nb_ex_aequo += 1
+                if random.random() * nb_ex_aequo < 1:     # Probabilité 1 / nb_ex_aequo
+                    meilleur_coup = mv
         self.score_dernier_coup = meilleur_score
-        return random.choice(meilleurs)
+        return meilleur_coup
 
 
 # =============================================================================
 # IADifficile — Minimax profondeur 4 avec élagage alpha-beta + heuristique avancée
 # =============================================================================
+def coups_tactiques(etat):
+    """Bitboard 81 bits des coups du plateau actif qui gagnent immédiatement
+    ce sous-plateau pour le camp au trait.
+    Vide quand le coup est libre : l’extension ne porte que sur un combat local."""
+    if etat.active == PLATEAU_LIBRE:
+        return 0
+    decalage = 9 * etat.active
+    bb       = etat.bb_o if etat.current else etat.bb_x
+    return etat.legal_mask & (COUPS_GAGNANTS[(bb >> decalage) & GRILLE_PLEINE] << decalage)
+
+
+def _quiescence(etat, alpha, beta, est_max, joueur):
+    """Feuille de la recherche alpha-beta, prolongée d’un demi-coup si le
+    camp au trait peut gagner le plateau actif (effet d’horizon).
+
+    Le camp au trait peut s’en tenir à l’évaluation statique (« stand pat »)
+    ou jouer l’un des coups gagnants — en général 1 ou 2 coups."""
+    statique  = _evaluer_difficile(etat, joueur)
+    tactiques = coups_tactiques(etat)
+    if not tactiques:
+        return statique
+    val = statique
+    if est_max:
+        if val >= beta:
+            return val
+        while tactiques:
+            bit = tactiques & -tactiques
+            tactiques ^= bit
+            sc = _evaluer_difficile(etat.jouer_coup(*COUPS[bit.bit_length() - 1]), joueur)
+            if sc > val:
+                val = sc
+                if val >= beta:
+                    break
+    else:
+        if val <= alpha:
+            return val
+        while tactiques:
+            bit = tactiques & -tactiques
+            tactiques ^= bit
+            sc = _evaluer_difficile(etat.jouer_coup(*COUPS[bit.bit_length() - 1]), joueur)
+            if sc < val:
+                val = sc
+                if val <= alpha:
+                    break
+    return val
+
+
+def _minimax_ab(etat, restant, alpha, beta, est_max, joueur, vue, tt):
+    """Noyau de recherche alpha-beta, en fonction libre.
+
+    Ne dépend que de l’état et de paramètres explicites (aucun attribut
+    d’instance à relire à chaque nœud) : `restant` = profondeur restante,
+    `vue` = clé XORée au hash selon le camp évalué, `tt` = table partagée."""
+    if etat.jeu_termine:
+        return _evaluer_difficile(etat, joueur)
+    if restant == 0:
+        return _quiescence(etat, alpha, beta, est_max, joueur)
+
+    # Position déjà recherchée au moins aussi profondément ? --------------
+    cle    = etat.hash ^ vue
+    entree = tt.sonder(cle)
+    if entree is not None and entree[1] >= restant:
+        valeur, drapeau = entree[2], entree[3]
+        if drapeau == EXACT:
+            return valeur
+        if drapeau == LOWER:
+            if valeur > alpha:
+                alpha = valeur
+        elif valeur < beta:
+            beta = valeur
+        if alpha >= beta:
+            return valeur
+    alpha_initial, beta_initial = alpha, beta
+    coups = ordonner_coups(etat, entree[4] if entree is not None else None)
+
+    meilleur_coup = None
+    if est_max:
+        val = -INF
+        for mv in coups:
+            sc = _minimax_ab(etat.jouer_coup(*mv), restant-1, alpha, beta, False, joueur, vue, tt)
+            if sc > val:
+                val, meilleur_coup = sc, mv
+                if val > alpha:
+                    alpha = val
+            if alpha >= beta:
+                break
+    else:
+        val = INF
+        for mv in coups:
+            sc = _minimax_ab(etat.jouer_coup(*mv), restant-1, alpha, beta, True, joueur, vue, tt)
+            if sc < val:
+                val, meilleur_coup = sc, mv
+                if val < beta:
+                    beta = val
+            if alpha >= beta:
+                break
+
+    # Mémorise le résultat : exact, ou simple borne si coupure -------------
+    if val <= alpha_initial:
+        drapeau = UPPER
+    elif val >= beta_initial:
+        drapeau = LOWER
+    else:
+        drapeau = EXACT
+    tt.stocker(cle, restant, val, drapeau, meilleur_coup)
+    return val
+
+
+_tt_processus = None    # Table de transposition propre à chaque processus de calcul
+
+
+def _recherche_sous_arbre(etat, restant, alpha, joueur, vue, beta=INF):
+    """Tâche exécutée dans un processus de calcul : valeur αβ d’un coup racine
+    dans la fenêtre (alpha, beta)."""
+    global _tt_processus
+    if _tt_processus is None:
+        _tt_processus = TableTransposition()
+    return _minimax_ab(etat, restant, alpha, beta, False, joueur, vue, _tt_processus)
+
+
 class IADifficile(IA):
+    nom = "IA Difficile"
+
     def __init__(self, joueur):
         super().__init__(joueur)
-        self.nom             = "IA Difficile"
         self.profondeur_max  = 4
+        self.tt              = TableTransposition()
+        self.cache_racine    = CacheRacine()   # (hash ^ vue) -> coups racine triés sur 1 coup
 
     # -----------------------------------------------------------------
     # Minimax alpha-beta
@@ -277,38 +608,87 @@ class IADifficile(IA):
     def minimax(self, partie, profondeur, alpha, beta, est_max):
         """Recherche alpha-beta. `alpha` = valeur max garantie, `beta` = valeur min garantie."""
         # self.coups_evalues += 1
-        if partie.jeu_termine or profondeur == self.profondeur_max:
-            return evaluer_difficile(partie, self.joueur)
-        if est_max:
-            val = -math.inf
-            for mv in partie.obtenir_coups_valides():
-                clone = partie.dupliquer(); clone.jouer_coup(*mv)
-                val = max(val, self.minimax(clone, profondeur+1, alpha, beta, False))
-                alpha = max(alpha, val)
-                if alpha >= beta:
-                    break
-            return val
-        else:
-            val = math.inf
-            for mv in partie.obtenir_coups_valides():
-                clone = partie.dupliquer(); clone.jouer_coup(*mv)
-                val = min(val, self.minimax(clone, profondeur+1, alpha, beta, True))
-                beta = min(beta, val)
-                if alpha >= beta:
-                    break
-            return val
+        return _minimax_ab(partie.vers_etat_rapide(), self.profondeur_max - profondeur, alpha, beta, est_max,
+                           self.joueur, self.vue(), self.tt)
+
+    def vue(self):
+        """Clé XORée aux hash : une même position n’a pas la même valeur pour X et O."""
+        return ZOB_VUE_O if self.joueur == 'O' else 0
 
     def get_move(self, partie):
-        """Évalue tous les coups racine avec minimax αβ et renvoie le meilleur."""
+        """Approfondissement itératif : recherches αβ de profondeur 1 à
+        profondeur_max, chacune essayant d’abord le meilleur coup de la
+        précédente (la table de transposition est partagée)."""
+        etat = partie.vers_etat_rapide()                  # Simulation sur FastState
         # self.coups_evalues = 0
-        meilleur_score     = -math.inf
-        meilleur_coup      = None
-        alpha, beta        = -math.inf, math.inf
-        for mv in self.obtenir_coups_valides(partie):
-            clone = partie.dupliquer(); clone.jouer_coup(*mv)
-            sc = self.minimax(clone, 1, alpha, beta, False)
-            if sc > meilleur_score:
-                meilleur_score, meilleur_coup = sc, mv
-            alpha = max(alpha, meilleur_score)          # Mise à jour α
+        meilleur_score, meilleur_coup = -INF, None
+        for profondeur in range(1, self.profondeur_max + 1):
+            meilleur_score, meilleur_coup = self.recherche_racine(etat, profondeur, meilleur_coup)
         self.score_dernier_coup = meilleur_score
         return meilleur_coup
+
+    def ordonner_racine(self, etat, vue, premier_coup=None):
+        """Coups racine triés par evaluer_difficile de l’état fils (tri stable,
+        après ordonner_coups), le coup `premier_coup` en tête.
+
+        Le pré-tri ne dépend que de la position : il est mémorisé dans
+        cache_racine et resservi aux profondeurs suivantes, voire aux parties
+        suivantes si le cache est partagé."""
+        cle = etat.hash ^ vue
+        coups = self.cache_racine.sonder(cle)
+        if coups is None:
+            coups = sorted(ordonner_coups(etat),
+                           key=lambda mv: _evaluer_difficile(etat.jouer_coup(*mv), self.joueur),
+                           reverse=True)
+            self.cache_racine.stocker(cle, coups)
+        if premier_coup in coups:
+            return [premier_coup] + [mv for mv in coups if mv != premier_coup]
+        return coups
+
+    def recherche_racine(self, etat, profondeur, premier_coup=None, alpha=-INF, beta=INF):
+        """Évalue tous les coups racine avec minimax αβ ; renvoie (score, coup).
+
+        Une fenêtre (alpha, beta) plus étroite que (-INF, INF) sert de fenêtre
+        d’aspiration : un score <= alpha ou >= beta n’est alors qu’une borne,
+        et l’appelant doit relancer la recherche avec une fenêtre élargie."""
+        vue                = self.vue()
+        meilleur_score     = -INF
+        meilleur_coup      = None
+        alpha_initial      = alpha
+        if premier_coup is None:
+            entree       = self.tt.sonder(etat.hash ^ vue)
+            premier_coup = entree[4] if entree is not None else None
+        coups = self.ordonner_racine(etat, vue, premier_coup)
+        if self.nb_processus > 1 and len(coups) > 1:
+            # « Young brothers wait » : le premier coup, séquentiel, fixe α ;
+            # ses frères sont ensuite recherchés en parallèle avec cet α.
+            sc = _minimax_ab(etat.jouer_coup(*coups[0]), profondeur - 1, alpha, beta, False,
+                             self.joueur, vue, self.tt)
+            scores = [sc]
+            if sc < beta:
+                freres = [etat.jouer_coup(*mv) for mv in coups[1:]]
+                tache  = partial(_recherche_sous_arbre, restant=profondeur - 1, alpha=max(alpha, sc),
+                                 joueur=self.joueur, vue=vue, beta=beta)
+                scores.extend(self.executeur().map(tache, freres))
+            for mv, sc in zip(coups, scores):
+                if sc > meilleur_score:
+                    meilleur_score, meilleur_coup = sc, mv
+        else:
+            for mv in coups:
+                enfant = etat.jouer_coup(*mv)
+                sc = _minimax_ab(enfant, profondeur - 1, alpha, beta, False, self.joueur, vue, self.tt)
+                if sc > meilleur_score:
+                    meilleur_score, meilleur_coup = sc, mv
+                    if sc > alpha:
+                        alpha = sc                      # Mise à jour α
+                if alpha >= beta:                       # Dépasse la fenêtre d’aspiration
+                    break
+        # Hors de la fenêtre, le score n’est qu’une borne -------------------
+        if meilleur_score <= alpha_initial:
+            drapeau = UPPER
+        elif meilleur_score >= beta:
+            drapeau = LOWER
+        else:
+            drapeau = EXACT
+        self.tt.stocker(etat.hash ^ vue, profondeur, meilleur_score, drapeau, meilleur_coup)
+        return meilleur_score, meilleur_coup
@@ -4,6 +4,7 @@
 # Ce module définit :
 #   • PetitPlateau  : sous‑grille classique 3 × 3 (un « petit » morpion)
 #   • MorpionUltime : plateau global 3 × 3 de PetitPlateau
+#   • FastState     : état compact (quelques entiers) utilisé par la recherche IA
 #   • Deux modes console             : humain_vs_humain et humain_vs_ia
 #
 #  > Toutes les règles du « Morpion Ultime » sont implémentées :
@@ -19,19 +20,92 @@
 #    chaque portion de code.
 # -----------------------------------------------------------------------------
 
+import random
+import re
+
+# =============================================================================
+# Tables précalculées — représentation « bitboard » d’une grille 3 × 3
+# =============================================================================
+#  Une grille 3 × 3 est codée par deux entiers de 9 bits (un par joueur) :
+#  la case (l, c) correspond au bit 3*l + c.
+#
+#       bit :  0 | 1 | 2
+#              3 | 4 | 5
+#              6 | 7 | 8
+#
+#  Tester une ligne gagnante revient alors à un simple ET binaire.
+GRILLE_PLEINE = 0x1FF                       # Les 9 cases occupées
+
+WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,  # 3 lignes horizontales
+    0b001001001, 0b010010010, 0b100100100,  # 3 colonnes
+    0b100010001, 0b001010100,               # 2 diagonales
+)
+
+POPCOUNT = tuple(bin(i).count('1') for i in range(GRILLE_PLEINE + 1))  # Nb de bits à 1
+CASES    = tuple(divmod(k, 3) for k in range(9))                        # bit -> (ligne, colonne)
+LIGNES_TEXTE = tuple(                       # (bits X << 3) | bits O d’une ligne -> "X| |O"
+    "|".join('X' if (x >> c) & 1 else 'O' if (o >> c) & 1 else ' ' for c in range(3))
+    for x in range(8) for o in range(8)
+)
+
+#  Le plateau global complet (FastState) juxtapose les 9 sous‑grilles dans un
+#  seul entier de 81 bits : la sous‑grille (i, j) occupe les bits
+#  SUBBOARD_SHIFT[i][j] … SUBBOARD_SHIFT[i][j] + 8.
+SUBBOARD_SHIFT = tuple(tuple(9 * (3 * i + j) for j in range(3)) for i in range(3))
+PLATEAU_LIBRE  = 9                          # Valeur de `active` quand le coup est libre
+COUPS = tuple(                              # bit global -> (sp_l, sp_c, cel_l, cel_c)
+    CASES[k // 9] + CASES[k % 9] for k in range(81)
+)
+CASES_PLATEAU  = tuple(GRILLE_PLEINE << 9 * p for p in range(9))  # Les 81 bits, par sous‑plateau
+CASES_OUVERTES = tuple(                     # bitboard 9 bits des plateaux finis -> cases hors de ceux‑ci
+    sum(CASES_PLATEAU[p] for p in range(9) if not (finis >> p) & 1)
+    for finis in range(GRILLE_PLEINE + 1)
+)
+
+#  Clés de Zobrist : le hash d’un état est le XOR des clés de ses cases
+#  occupées, du sous‑plateau imposé et du trait.  Graine fixe → les hash sont
+#  identiques d’une exécution (ou d’un processus) à l’autre.
+_alea_zobrist = random.Random(0x5EED)
+ZOB        = tuple(tuple(_alea_zobrist.getrandbits(64) for _ in range(81)) for _ in range(2))
+ZOB_ACTIVE = tuple(_alea_zobrist.getrandbits(64) for _ in range(PLATEAU_LIBRE + 1))
+ZOB_TRAIT  = _alea_zobrist.getrandbits(64)        # XOR quand 'O' a le trait
+
+
+def coups_legaux(bb_x, bb_o, won_x, won_o, drawn, active):
+    """Bitboard 81 bits des cases jouables (cases vides du plateau imposé
+    ou, si le coup est libre, de tous les sous‑plateaux en cours)."""
+    if active != PLATEAU_LIBRE:
+        return CASES_PLATEAU[active] & ~(bb_x | bb_o)
+    return CASES_OUVERTES[won_x | won_o | drawn] & ~(bb_x | bb_o)
+
+
+def zobrist(bb_x, bb_o, active, current):
+    """Hash de Zobrist complet (calcul from scratch) d’un état."""
+    h = ZOB_ACTIVE[active] ^ (ZOB_TRAIT if current else 0)
+    for k in range(81):
+        if (bb_x >> k) & 1:
+            h ^= ZOB[0][k]
+        elif (bb_o >> k) & 1:
+            h ^= ZOB[1][k]
+    return h
+
+
 # =============================================================================
 # Classe « PetitPlateau » — un morpion 3 × 3 classique
 # =============================================================================
 class PetitPlateau:
-    """Sous‑grille 3 × 3.
+    """Sous‑grille 3 × 3.
     
     Attributs
     ---------
-    plateau      : list[list[str]]  — contient 'X', 'O' ou ' ' (vide)
+    bb_x, bb_o   : int              — bitboards 9 bits des cases de 'X' et de 'O'
     vainqueur    : str | None       — 'X', 'O', "DRAW" ou None si en cours
     jeu_termine  : bool             — True lorsque ce sous‑plateau est terminé
     """
 
+    __slots__ = ('bb_x', 'bb_o', 'vainqueur', 'jeu_termine')   # Pas de __dict__ par instance
+
     def __init__(self):
         # Appelle directement la méthode qui (re)met tout à zéro
         self.reinitialiser()
@@ -41,7 +115,7 @@ class PetitPlateau:
     # -----------------------------------------------------------------
     def reinitialiser(self):
         """Vide le plateau et remet les états à leur valeur initiale."""
-        self.plateau     = [[' ' for _ in range(3)] for _ in range(3)]  # Grille vide
+        self.bb_x = self.bb_o = 0   # Grille vide
         self.vainqueur   = None     # Pas de gagnant
         self.jeu_termine = False    # Sous‑partie encore active
 
@@ -50,37 +124,36 @@ class PetitPlateau:
         return (
             0 <= ligne < 3 and
             0 <= colonne < 3 and
-            self.plateau[ligne][colonne] == ' ' and  # Case vide
-            not self.jeu_termine                     # Sous‑plateau encore en cours
+            not ((self.bb_x | self.bb_o) >> (3 * ligne + colonne)) & 1 and  # Case vide
+            not self.jeu_termine                                       # Sous‑plateau encore en cours
         )
 
     def jouer_coup(self, ligne, colonne, joueur):
         """Effectue le coup du joueur ; renvoie False si le coup n’est pas légal."""
         if self.coup_valide(ligne, colonne):
-            self.plateau[ligne][colonne] = joueur         # Place le symbole
+            bit = 1 << (3 * ligne + colonne)              # Place le symbole
+            if joueur == 'X':
+                self.bb_x |= bit
+            else:
+                self.bb_o |= bit
             self.verifier_etat(joueur)                    # Met à jour vainqueur/nul
             return True
         return False
 
     def verifier_etat(self, joueur):
         """Après chaque coup, vérifie victoire ou match nul."""
-        # --- 3 lignes horizontales + 3 colonnes ------------------------
-        for i in range(3):
-            if all(self.plateau[i][j] == joueur for j in range(3)):
-                self.vainqueur, self.jeu_termine = joueur, True; return
-            if all(self.plateau[j][i] == joueur for j in range(3)):
+        # --- 3 lignes, 3 colonnes, 2 diagonales : un ET par masque ------
+        bb = self.bb_x if joueur == 'X' else self.bb_o
+        for masque in WIN_MASKS:
+            if bb & masque == masque:
                 self.vainqueur, self.jeu_termine = joueur, True; return
-        # --- 2 diagonales ----------------------------------------------
-        if (self.plateau[0][0] == self.plateau[1][1] == self.plateau[2][2] == joueur) or \
-           (self.plateau[0][2] == self.plateau[1][1] == self.plateau[2][0] == joueur):
-            self.vainqueur, self.jeu_termine = joueur, True; return
         # --- Match nul --------------------------------------------------
         if self.est_nul():
             self.vainqueur, self.jeu_termine = "DRAW", True  # Plateau rempli
 
     def est_nul(self):
         """True si plus aucune case vide et aucun vainqueur."""
-        return all(self.plateau[i][j] != ' ' for i in range(3) for j in range(3))
+        return (self.bb_x | self.bb_o) == GRILLE_PLEINE
 
     # -----------------------------------------------------------------
     # Méthodes utilitaires
@@ -89,10 +162,30 @@ class PetitPlateau:
         """Renvoie le vainqueur actuel ('X', 'O', 'DRAW') ou None."""
         return self.vainqueur
 
+    def case(self, ligne, colonne):
+        """Renvoie le contenu de la case (ligne, colonne) : 'X', 'O' ou ' '."""
+        bit = 1 << (3 * ligne + colonne)
+        if self.bb_x & bit:
+            return 'X'
+        if self.bb_o & bit:
+            return 'O'
+        return ' '
+
+    def ligne(self, ligne):
+        """Ligne `ligne` de la grille, déjà formatée pour l’affichage : "X| |O"."""
+        decalage = 3 * ligne
+        return LIGNES_TEXTE[((self.bb_x >> decalage) & 0b111) << 3 | ((self.bb_o >> decalage) & 0b111)]
+
+    @property
+    def plateau(self):
+        """Vue list[list[str]] de la grille, reconstruite à la demande (affichage)."""
+        return [[self.case(i, j) for j in range(3)] for i in range(3)]
+
     def dupliquer(self):
-        """Retourne une DEEP‑COPY de ce PetitPlateau (pour l’IA)."""
+        """Retourne une copie de ce PetitPlateau (pour l’IA) — deux entiers à recopier."""
         nouveau               = PetitPlateau()
-        nouveau.plateau       = [ligne[:] for ligne in self.plateau]  # Copie chaque ligne
+        nouveau.bb_x          = self.bb_x
+        nouveau.bb_o          = self.bb_o
         nouveau.vainqueur     = self.vainqueur
         nouveau.jeu_termine   = self.jeu_termine
         return nouveau
@@ -110,6 +203,8 @@ class PetitPlateau:
 class MorpionUltime:
     """Implémente toutes les règles du Morpion Ultime."""
 
+    __slots__ = ('plateaux', 'joueur_courant', 'joueur_index', 'plateau_actif', 'jeu_termine', 'vainqueur')
+
     def __init__(self):
         self.reinitialiser()
 
@@ -119,6 +214,7 @@ class MorpionUltime:
     def reinitialiser(self):
         self.plateaux       = [[PetitPlateau() for _ in range(3)] for _ in range(3)]
         self.joueur_courant = 'X'       # Le joueur qui doit jouer maintenant
+        self.joueur_index   = 0         # Idem en entier : 0 pour 'X', 1 pour 'O'
         self.plateau_actif  = None      # None -> le prochain coup est « libre »
         self.jeu_termine    = False
         self.vainqueur      = None
@@ -156,7 +252,8 @@ class MorpionUltime:
 
         # Change de joueur si la partie continue -------------------------
         if not self.jeu_termine:
-            self.joueur_courant = 'O' if self.joueur_courant == 'X' else 'X'
+            self.joueur_index  ^= 1
+            self.joueur_courant = 'XO'[self.joueur_index]
         return True
 
     # -----------------------------------------------------------------
@@ -164,46 +261,23 @@ class MorpionUltime:
     # -----------------------------------------------------------------
     def mettre_a_jour_etat_global(self):
         """Analyse l’état des sous‑plateaux pour savoir si la partie est gagnée/nulle."""
-        # 1) Crée une grille virtuelle indiquant le vainqueur de chaque sous‑plateau
-        global_p = [[' ' for _ in range(3)] for _ in range(3)]
+        # 1) Résume le méta‑plateau en trois bitboards 9 bits (bit = 3*i + j)
+        won_x = won_o = drawn = 0
         for i in range(3):
             for j in range(3):
                 vainq = self.plateaux[i][j].obtenir_vainqueur()
-                global_p[i][j] = vainq if vainq is not None else ' '
+                if vainq == 'X':
+                    won_x |= 1 << (3 * i + j)
+                elif vainq == 'O':
+                    won_o |= 1 << (3 * i + j)
+                elif vainq == "DRAW":
+                    drawn |= 1 << (3 * i + j)
 
-        # 2) Recherche d’une ligne/colonne/diagonale complète (victoire globale)
-        for i in range(3):
-            # Ligne horizontale i
-            if global_p[i][0] != ' ' and global_p[i][0] != "DRAW" and \
-               all(global_p[i][j] == global_p[i][0] for j in range(3)):
-                self.vainqueur, self.jeu_termine = global_p[i][0], True; return
-            # Ligne verticale i
-            if global_p[0][i] != ' ' and global_p[0][i] != "DRAW" and \
-               all(global_p[j][i] == global_p[0][i] for j in range(3)):
-                self.vainqueur, self.jeu_termine = global_p[0][i], True; return
-        # Diagonale principale
-        if global_p[0][0] != ' ' and global_p[0][0] != "DRAW" and \
-           global_p[0][0] == global_p[1][1] == global_p[2][2]:
-            self.vainqueur, self.jeu_termine = global_p[0][0], True; return
-        # Diagonale secondaire
-        if global_p[0][2] != ' ' and global_p[0][2] != "DRAW" and \
-           global_p[0][2] == global_p[1][1] == global_p[2][0]:
-            self.vainqueur, self.jeu_termine = global_p[0][2], True; return
-
-        # 3) Match nul global : plus aucun sous‑plateau jouable
-        if all(self.plateaux[i][j].jeu_termine for i in range(3) for j in range(3)):
-            self.jeu_termine, self.vainqueur = True, None; return
-
-        # 4) Option « nulle anticipée » : plus aucune victoire théorique possible
-        combinaisons = [
-            [(0,0),(0,1),(0,2)], [(1,0),(1,1),(1,2)], [(2,0),(2,1),(2,2)],
-            [(0,0),(1,0),(2,0)], [(0,1),(1,1),(2,1)], [(0,2),(1,2),(2,2)],
-            [(0,0),(1,1),(2,2)], [(0,2),(1,1),(2,0)]
-        ]
-        def peut_encore_gagner(joueur):
-            return any(all(global_p[r][c] in [joueur,' '] for (r,c) in combo) for combo in combinaisons)
-        if not peut_encore_gagner('X') and not peut_encore_gagner('O'):
-            self.jeu_termine, self.vainqueur = True, None
+        # 2) Victoire globale, plateau épuisé ou « nulle anticipée » : un ET
+        #    par masque de WIN_MASKS (mêmes règles que pour FastState)
+        fini, vainqueur = _etat_global(won_x, won_o, drawn)
+        if fini:
+            self.jeu_termine, self.vainqueur = True, vainqueur
 
     # -----------------------------------------------------------------
     # Méthodes utilitaires
@@ -213,24 +287,26 @@ class MorpionUltime:
         coups = []
         if self.plateau_actif is not None:
             sp_l, sp_c = self.plateau_actif
-            plateau = self.plateaux[sp_l][sp_c]
-            for i in range(3):
-                for j in range(3):
-                    if plateau.coup_valide(i, j):
-                        coups.append((sp_l, sp_c, i, j))
+            self._ajouter_coups(coups, sp_l, sp_c)
         else:
             # Parcourt tous les sous‑plateaux non terminés
             for sp_l in range(3):
                 for sp_c in range(3):
-                    plateau = self.plateaux[sp_l][sp_c]
-                    if plateau.jeu_termine:
-                        continue
-                    for i in range(3):
-                        for j in range(3):
-                            if plateau.coup_valide(i, j):
-                                coups.append((sp_l, sp_c, i, j))
+                    self._ajouter_coups(coups, sp_l, sp_c)
         return coups
 
+    def _ajouter_coups(self, coups, sp_l, sp_c):
+        """Ajoute à `coups` les cases vides du sous‑plateau (sp_l, sp_c) s’il est en cours."""
+        plateau = self.plateaux[sp_l][sp_c]
+        if plateau.jeu_termine:
+            return
+        vides = ~(plateau.bb_x | plateau.bb_o) & GRILLE_PLEINE
+        while vides:                                # Bit de poids faible d’abord
+            bit    = vides & -vides
+            vides ^= bit
+            cel_l, cel_c = CASES[bit.bit_length() - 1]
+            coups.append((sp_l, sp_c, cel_l, cel_c))
+
     def obtenir_vainqueur(self):
         """Renvoie le vainqueur ('X', 'O') ou None (nulle/en cours)."""
         return self.vainqueur
@@ -240,11 +316,31 @@ class MorpionUltime:
         clone = MorpionUltime()
         clone.plateaux       = [[self.plateaux[i][j].dupliquer() for j in range(3)] for i in range(3)]
         clone.joueur_courant = self.joueur_courant
+        clone.joueur_index   = self.joueur_index
         clone.plateau_actif  = self.plateau_actif
         clone.jeu_termine    = self.jeu_termine
         clone.vainqueur      = self.vainqueur
         return clone
 
+    def vers_etat_rapide(self):
+        """Convertit la partie en FastState (représentation de travail de l’IA)."""
+        bb_x = bb_o = won_x = won_o = drawn = 0
+        for i in range(3):
+            for j in range(3):
+                sp    = self.plateaux[i][j]
+                bb_x |= sp.bb_x << SUBBOARD_SHIFT[i][j]
+                bb_o |= sp.bb_o << SUBBOARD_SHIFT[i][j]
+                bit   = 1 << (3 * i + j)
+                if sp.vainqueur == 'X':
+                    won_x |= bit
+                elif sp.vainqueur == 'O':
+                    won_o |= bit
+                elif sp.vainqueur == "DRAW":
+                    drawn |= bit
+        active = PLATEAU_LIBRE if self.plateau_actif is None else 3 * self.plateau_actif[0] + self.plateau_actif[1]
+        return FastState(bb_x, bb_o, won_x, won_o, drawn, active, self.joueur_index,
+                         self.jeu_termine, self.vainqueur)
+
     # -----------------------------------------------------------------
     # Affichage console — format grille ASCII 9 × 9
     # -----------------------------------------------------------------
@@ -255,7 +351,7 @@ class MorpionUltime:
                 ligne = ""
                 for grand_c in range(3):
                     plateau = self.plateaux[grand_l][grand_c]
-                    ligne += " " + "|".join(plateau.plateau[petit_l]) + " "
+                    ligne += " " + plateau.ligne(petit_l) + " "
                     if grand_c < 2:
                         ligne += "||"
                 lignes.append(ligne)
@@ -266,55 +362,219 @@ class MorpionUltime:
         print(f"Joueur courant : {self.joueur_courant}")
 
 
+# =============================================================================
+# Classe « FastState » — le même état, réduit à quelques entiers
+# =============================================================================
+def _etat_global(won_x, won_o, drawn):
+    """(jeu_termine, vainqueur) d’après les bitboards 9 bits des sous‑plateaux finis.
+
+    Mêmes règles que MorpionUltime.mettre_a_jour_etat_global."""
+    for m in WIN_MASKS:
+        if won_x & m == m:
+            return True, 'X'
+        if won_o & m == m:
+            return True, 'O'
+    if won_x | won_o | drawn == GRILLE_PLEINE:      # Plus aucun sous‑plateau jouable
+        return True, None
+    # Une ligne reste gagnable tant qu’elle ne contient ni adversaire ni nulle
+    if not any(not (won_o | drawn) & m for m in WIN_MASKS) and \
+       not any(not (won_x | drawn) & m for m in WIN_MASKS):
+        return True, None
+    return False, None
+
+
+class FastState:
+    """État complet d’une partie sous forme d’entiers, pour la recherche de l’IA.
+
+    Un FastState n’est jamais modifié : `jouer_coup` renvoie un nouvel état,
+    ce qui évite toute copie profonde pendant la recherche.  Les parents
+    restent intacts : la recherche n’a aucun coup à « annuler » en remontant
+    (sauvegarder puis restaurer les 11 champs coûterait plus cher que
+    d’allouer le nouvel état).
+
+    Attributs
+    ---------
+    bb_x, bb_o          : int        — bitboards 81 bits des cases de 'X' et de 'O'
+    won_x, won_o, drawn : int        — bitboards 9 bits des sous‑plateaux gagnés / nuls
+    active              : int        — sous‑plateau imposé (3*i + j) ou PLATEAU_LIBRE
+    current             : int        — 0 si 'X' doit jouer, 1 si c’est 'O'
+    jeu_termine         : bool
+    vainqueur           : str | None — 'X', 'O' ou None (nulle/en cours)
+    hash                : int        — hash de Zobrist, tenu à jour par jouer_coup
+    legal_mask          : int        — bitboard 81 bits des coups légaux
+    """
+
+    __slots__ = ('bb_x', 'bb_o', 'won_x', 'won_o', 'drawn', 'active', 'current',
+                 'jeu_termine', 'vainqueur', 'hash', 'legal_mask')
+
+    def __init__(self, bb_x, bb_o, won_x, won_o, drawn, active, current,
+                 jeu_termine=False, vainqueur=None, hash=None, legal_mask=None):
+        self.bb_x        = bb_x
+        self.bb_o        = bb_o
+        self.won_x       = won_x
+        self.won_o       = won_o
+        self.drawn       = drawn
+        self.active      = active
+        self.current     = current
+        self.jeu_termine = jeu_termine
+        self.vainqueur   = vainqueur
+        self.hash        = zobrist(bb_x, bb_o, active, current) if hash is None else hash
+        self.legal_mask  = coups_legaux(bb_x, bb_o, won_x, won_o, drawn, active) \
+                           if legal_mask is None else legal_mask
+
+    # -----------------------------------------------------------------
+    # Vues compatibles avec MorpionUltime
+    # -----------------------------------------------------------------
+    @property
+    def joueur_courant(self):
+        return 'XO'[self.current]
+
+    @property
+    def joueur_index(self):
+        return self.current
+
+    @property
+    def plateau_actif(self):
+        return None if self.active == PLATEAU_LIBRE else CASES[self.active]
+
+    def obtenir_vainqueur(self):
+        return self.vainqueur
+
+    def vers_etat_rapide(self):
+        return self
+
+    def dupliquer(self):
+        """Copie superficielle : les entiers sont immuables, rien d’autre à copier."""
+        return FastState(self.bb_x, self.bb_o, self.won_x, self.won_o, self.drawn,
+                         self.active, self.current, self.jeu_termine, self.vainqueur,
+                         self.hash, self.legal_mask)
+
+    # -----------------------------------------------------------------
+    # Coups
+    # -----------------------------------------------------------------
+    def obtenir_coups_valides(self):
+        """Liste des coups légaux, dans le même ordre que MorpionUltime."""
+        coups   = []
+        legaux  = self.legal_mask
+        while legaux:                               # Bit de poids faible d’abord
+            bit     = legaux & -legaux
+            legaux ^= bit
+            coups.append(COUPS[bit.bit_length() - 1])
+        return coups
+
+    def jouer_coup(self, sp_l, sp_c, cel_l, cel_c):
+        """Renvoie l’état obtenu après le coup (supposé légal) du joueur courant."""
+        p     = 3 * sp_l + sp_c
+        base  = 9 * p
+        k     = base + 3 * cel_l + cel_c
+        bit   = 1 << k
+        bb_x, bb_o = self.bb_x, self.bb_o
+        won_x, won_o, drawn = self.won_x, self.won_o, self.drawn
+        if self.current == 0:
+            bb_x |= bit
+            sous  = (bb_x >> base) & GRILLE_PLEINE
+        else:
+            bb_o |= bit
+            sous  = (bb_o >> base) & GRILLE_PLEINE
+
+        # Le sous‑plateau joué vient‑il de se terminer ? -----------------
+        fini = False
+        for m in WIN_MASKS:
+            if sous & m == m:
+                if self.current == 0:
+                    won_x |= 1 << p
+                else:
+                    won_o |= 1 << p
+                fini = True
+                break
+        else:
+            if ((bb_x | bb_o) >> base) & GRILLE_PLEINE == GRILLE_PLEINE:
+                drawn |= 1 << p
+                fini = True
+        jeu_termine, vainqueur = _etat_global(won_x, won_o, drawn) if fini else (False, None)
+
+        # Prochain sous‑plateau imposé et changement de joueur ------------
+        prochain = 3 * cel_l + cel_c
+        active   = PLATEAU_LIBRE if ((won_x | won_o | drawn) >> prochain) & 1 else prochain
+        current  = self.current if jeu_termine else 1 - self.current
+
+        # Hash incrémental : case posée, sous‑plateau imposé, trait --------
+        h = self.hash ^ ZOB[self.current][k] ^ ZOB_ACTIVE[self.active] ^ ZOB_ACTIVE[active]
+        if current != self.current:
+            h ^= ZOB_TRAIT
+        return FastState(bb_x, bb_o, won_x, won_o, drawn, active, current,
+                         jeu_termine, vainqueur, h,
+                         coups_legaux(bb_x, bb_o, won_x, won_o, drawn, active))
+
+
+# Position de départ, partagée : un FastState ne se modifie jamais
+ETAT_INITIAL = MorpionUltime().vers_etat_rapide()
+
+
 # =============================================================================
 # Fonctions console — 2 joueurs humains ou Humain vs IA
 # =============================================================================
+# Un coup saisi : quatre chiffres séparés par des blancs, compilé une fois
+_MOTIF_COUP = re.compile(r'\s*(\d)\s+(\d)\s+(\d)\s+(\d)\s*$')
+
+
+def _lire_coup(invite="Votre coup : "):
+    """Lit un coup « sp_l sp_c cel_l cel_c » au clavier.
+
+    Renvoie le quadruplet d’entiers, ou None (après un message) si la saisie
+    n’est pas formée de 4 chiffres."""
+    entree = input(invite)
+    m = _MOTIF_COUP.match(entree)
+    if m is not None:                               # Cas courant : une seule passe
+        return int(m[1]), int(m[2]), int(m[3]), int(m[4])
+    # Saisie refusée : le message dépend de l’erreur
+    if len(entree.split()) != 4:
+        print("Merci d'entrer 4 nombres séparés par des espaces.")
+    else:
+        print("Veuillez entrer des nombres valides.")
+    return None
+
+
 def humain_vs_humain():
     """Lance une partie en local entre deux joueurs humains."""
     jeu = MorpionUltime()
     while not jeu.jeu_termine:
         jeu.afficher_plateau()
         print(f"Tour du joueur {jeu.joueur_courant}")
-        try:
-            print("Entrez : sp_l sp_c cel_l cel_c (0-2)")
-            entree = input("Votre coup : ").split()
-            if len(entree) != 4:
-                print("Merci d'entrer 4 nombres séparés par des espaces."); continue
-            sp_l, sp_c, cel_l, cel_c = map(int, entree)
-            if not jeu.jouer_coup(sp_l, sp_c, cel_l, cel_c):
-                print("Coup invalide ! Réessayez.")
-        except ValueError:
-            print("Veuillez entrer des nombres valides.")
+        print("Entrez : sp_l sp_c cel_l cel_c (0-2)")
+        coup = _lire_coup()
+        if coup is not None and not jeu.jouer_coup(*coup):
+            print("Coup invalide ! Réessayez.")
     jeu.afficher_plateau()
     gagnant = jeu.obtenir_vainqueur()
     print("Résultat :", f"le joueur {gagnant} gagne !" if gagnant else "Match nul !")
 
 
-def humain_vs_ia(ia):
-    """Fait s’affronter un joueur humain (X) contre une instance d’IA (O)."""
+def humain_vs_ia(ia, verbose=True):
+    """Fait s’affronter un joueur humain (X) contre une instance d’IA (O).
+
+    Avec verbose=False, rien n’est affiché entre les coups de l’IA : le
+    plateau n’est réaffiché qu’au tour de l’humain (appel depuis un script)."""
     jeu = MorpionUltime()
     joueur_humain, joueur_ia = 'X', 'O'
     print(f"Vous jouez {joueur_humain} contre {ia.nom}")
     while not jeu.jeu_termine:
-        jeu.afficher_plateau()
+        if verbose or jeu.joueur_courant == joueur_humain:
+            jeu.afficher_plateau()
         if jeu.joueur_courant == joueur_humain:
-            try:
-                print("Votre tour — saisissez : sp_l sp_c cel_l cel_c (0-2)")
-                entree = input("Votre coup : ").split()
-                if len(entree) != 4:
-                    print("Merci d'entrer 4 nombres."); continue
-                sp_l, sp_c, cel_l, cel_c = map(int, entree)
-                if not jeu.jouer_coup(sp_l, sp_c, cel_l, cel_c):
-                    print("Coup invalide ! Réessayez.")
-            except ValueError:
-                print("Veuillez entrer des nombres valides.")
+            print("Votre tour — saisissez : sp_l sp_c cel_l cel_c (0-2)")
+            coup = _lire_coup()
+            if coup is not None and not jeu.jouer_coup(*coup):
+                print("Coup invalide ! Réessayez.")
         else:
-            print(f"{ia.nom} réfléchit...")
+            if verbose:
+                print(f"{ia.nom} réfléchit...")
             coup = ia.get_move(jeu)                # L’IA calcule son coup
             if coup is None:                       # Cas limite (pas de coup possible)
                 print("Aucun coup valide pour l'IA !"); break
             jeu.jouer_coup(*coup)
-            print(f"{ia.nom} a joué plateau {coup[0],coup[1]} cellule {coup[2],coup[3]}")
+            if verbose:
+                print(f"{ia.nom} a joué plateau {coup[0],coup[1]} cellule {coup[2],coup[3]}")
     jeu.afficher_plateau()
     gagnant = jeu.obtenir_vainqueur()
     if gagnant == joueur_humain:
@@ -12,8 +12,12 @@
 #     - tournament.py → menu console + tournois automatisés
 # -----------------------------------------------------------------------------
 
-from tournament import menu_principal  # Importe le menu principal (console)
+from multiprocessing import freeze_support
+
+from tournament import menu_principal, options_ligne_de_commande  # Menu console + options
 
 # Lancement principal du programme si exécuté directement
 if __name__ == "__main__":
-    menu_principal()  # Affiche le menu interactif (voir tournament.py)
+    freeze_support()  # Requis par les processus de calcul dans l’exécutable PyInstaller
+    options = options_ligne_de_commande()   # --json CHEMIN : export des tournois
+    menu_principal(chemin_json=options.chemin_json)  # Affiche le menu interactif (voir tournament.py)
@@ -4,200 +4,386 @@
 #  Ce module permet :
 #     • de faire s’affronter deux IAs sur une série de parties          (lancer_match)
 #     • d’enchaîner tous les duels possibles entre un ensemble d’IAs    (tournoi_complet)
+#     • d’afficher le bilan de chaque duel, au fil du tournoi            (afficher_duel)
 #     • de proposer un petit menu interactif console                     (menu_principal)
+#
+#  Chaque partie est indépendante : elles sont toutes jouées en parallèle,
+#  une par tâche d’un ProcessPoolExecutor (_jouer_une_partie).
 # -----------------------------------------------------------------------------
 
+import argparse
+import io
+import json
+import random
+import sys
 import time
-from game import MorpionUltime
-from ai import IAFacile, IAMoyenne, IADifficile
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import combinations
+from game import ETAT_INITIAL
+from ai import IAFacile, IAMoyenne, IADifficile, TableTransposition, CacheRacine, INF
+
+# Bilan d’une partie, renvoyé par le processus qui l’a jouée.
+# gagnant : 1 (ia1), 2 (ia2) ou 0 (nul) ; temps : durée de la partie (s) ;
+# ns_ia1 / ns_ia2 : temps de réflexion cumulé de chaque IA (ns, 0 sans profil) ;
+# debut : instant de départ (perf_counter, horloge commune aux processus)
+StatsPartie = namedtuple('StatsPartie', [
+    'gagnant', 'coups_ia1', 'coups_ia2', 'score_ia1', 'score_ia2',
+    'nb_scores_ia1', 'nb_scores_ia2', 'ns_ia1', 'ns_ia2', 'temps', 'debut',
+])
+
+
+# Concurrents d’un tournoi complet : des classes, instanciées seulement dans
+# les processus qui jouent (le nom d’une IA est un attribut de classe)
+CLASSES_IA = (IAFacile, IAMoyenne, IADifficile)
+
+FENETRE_ASPIRATION = 50     # Demi-largeur de la fenêtre autour du score précédent
+
+
+def approfondissement_iteratif(ia, jeu, profondeur_max=None, budget_temps=None):
+    """Coup d’une IA à recherche αβ (méthode recherche_racine), par
+    approfondissement itératif piloté par le tournoi.
+
+    Chaque profondeur essaie d’abord le meilleur coup de la précédente et
+    cherche dans une fenêtre d’aspiration de ±FENETRE_ASPIRATION autour de
+    son score ; en cas d’échec haut/bas, la borne fautive est rouverte.
+    `budget_temps` (s) : n’entame plus de nouvelle profondeur une fois écoulé.
+    Renvoie (coup, score)."""
+    if profondeur_max is None:
+        profondeur_max = ia.profondeur_max
+    etat  = jeu.vers_etat_rapide()
+    debut = time.perf_counter()
+    score, coup = -INF, None
+    for profondeur in range(1, profondeur_max + 1):
+        if profondeur == 1:
+            alpha, beta = -INF, INF
+        else:
+            alpha, beta = score - FENETRE_ASPIRATION, score + FENETRE_ASPIRATION
+        while True:
+            score, meilleur = ia.recherche_racine(etat, profondeur, coup, alpha, beta)
+            if score <= alpha:          # Échec bas : le vrai score est plus faible
+                alpha = -INF
+            elif score >= beta:         # Échec haut : le vrai score est plus fort
+                beta = INF
+            else:
+                break
+        coup = meilleur
+        if budget_temps is not None and time.perf_counter() - debut > budget_temps:
+            break
+    return coup, score
+
+
+# Tables de transposition des processus du tournoi, une par classe d’IA :
+# elles survivent d’une partie à l’autre (ouvertures et milieux de partie
+# se répètent) sans mêler deux heuristiques différentes.
+_tables_processus = {}
+_caches_racine_processus = {}   # Idem pour les pré-tris des coups racine
+
+
+_ias_processus = {}             # (classe, symbole) -> instance réutilisée
+
+
+def _table_processus(classe):
+    """Table de transposition partagée par les IA `classe` de ce processus."""
+    if classe not in _tables_processus:
+        _tables_processus[classe] = TableTransposition()
+    return _tables_processus[classe]
+
+
+def _ia_processus(classe, symbole):
+    """Instance d’IA `classe` jouant `symbole`, créée une seule fois par
+    processus puis resservie à chaque partie (pas de nouvelle table de
+    transposition à allouer par partie)."""
+    cle = (classe, symbole)
+    if cle not in _ias_processus:
+        ia = classe(symbole)
+        ia.rapporter_score = True   # Score moyen par coup, coups aléatoires compris
+        if hasattr(ia, 'tt'):       # Recherche avec table : reprend celle du processus
+            ia.tt = _table_processus(classe)
+        if hasattr(ia, 'cache_racine'):
+            if classe not in _caches_racine_processus:
+                _caches_racine_processus[classe] = CacheRacine()
+            ia.cache_racine = _caches_racine_processus[classe]
+        _ias_processus[cle] = ia
+    return _ias_processus[cle]
+
+
+def _jouer_une_partie(graine, classe_ia1, classe_ia2, inverse, profil=False):
+    """Tâche d’un processus : joue une partie complète entre deux IA.
+
+    Seules les classes transitent entre processus ; `graine` rend la partie
+    reproductible (IA avec part d’aléa) et `inverse` donne 'X' à ia2.
+    Avec `profil`, chaque coup est chronométré (perf_counter_ns)."""
+    random.seed(graine)
+    debut = time.perf_counter()
+    # La partie se joue directement sur un FastState : ni conversion de
+    # MorpionUltime à chaque get_move, ni recopie des sous-plateaux ; l’état
+    # étant immuable, toutes les parties partent du même ETAT_INITIAL
+    jeu = ETAT_INITIAL
+    ia1 = _ia_processus(classe_ia1, 'O' if inverse else 'X')
+    ia2 = _ia_processus(classe_ia2, 'X' if inverse else 'O')
+    joueurs = (ia2, ia1) if inverse else (ia1, ia2)    # Indexé par jeu.current (0 = 'X')
+
+    # Compteurs à plat, dans l’ordre des champs de StatsPartie :
+    # [coups_ia1, coups_ia2, score_ia1, score_ia2, nb_scores_ia1, nb_scores_ia2,
+    #  ns_ia1, ns_ia2]
+    compteurs = [0] * 8
+    # --- Boucle tour par tour -------------------------------------------
+    # Aucun affichage ici : un FastState n’a même pas d’afficher_plateau, si
+    # bien qu’un affichage entre les coups ne peut pas s’y glisser par mégarde
+    while not jeu.jeu_termine:
+        ia_courante = joueurs[jeu.current]
+        cote        = jeu.current ^ inverse                 # 0 = ia1, 1 = ia2
+        if profil:
+            t0 = time.perf_counter_ns()
+        if hasattr(ia_courante, 'recherche_racine'):     # Recherche αβ : pilotée ici
+            coup, ia_courante.score_dernier_coup = approfondissement_iteratif(ia_courante, jeu)
+        else:
+            coup = ia_courante.get_move(jeu)    # IA choisit son action
+        if profil:
+            compteurs[6 + cote] += time.perf_counter_ns() - t0
+        if coup is None:                    # Sécurité (ne devrait pas arriver)
+            break
+
+        # Comptabilise les positions examinées et le score du coup choisi
+        compteurs[cote] += ia_courante.coups_evalues
+        sc = ia_courante.score_dernier_coup
+        if sc is not None:
+            compteurs[2 + cote] += sc
+            compteurs[4 + cote] += 1
+
+        # Applique le coup : nouvel état immuable
+        jeu = jeu.jouer_coup(*coup)
+
+    gagnant = jeu.obtenir_vainqueur()
+    # ia1 gagne si son symbole l’emporte : 'X' quand inverse est faux
+    gagnant = 0 if gagnant not in ('X', 'O') else 1 + ((gagnant == 'O') ^ inverse)
+    return StatsPartie(gagnant, *compteurs, time.perf_counter() - debut, debut)
+
 
 class Tournoi:
     """Orchestre des matchs entre deux IAs et collecte statistiques & résultats."""
 
-    def __init__(self):
+    def __init__(self, profil=False):
         # Dictionnaires pouvant être utilisés plus tard pour exporter les stats
         self.resultats = {}
         self.stats_performance = {}
+        # Chronométrage coup par coup des IA (clé 'temps_par_ia_ns' de perf)
+        self.profil = profil
 
     # -----------------------------------------------------------------
     # Lancer une série de parties entre deux IAs (aller-retour alterné)
     # -----------------------------------------------------------------
-    def lancer_match(self, ia1, ia2, nb_parties=10):
-        """Fait jouer ia1 et ia2 sur `nb_parties` manches.
+    def lancer_match(self, ia1, ia2, nb_parties=10, graine=None):
+        """Fait jouer ia1 et ia2 sur `nb_parties` manches, en parallèle.
+
+        Chaque manche est jouée, dans un processus du pool, par les instances
+        propres à ce processus des classes de ia1 et ia2 (ia1 / ia2 peuvent
+        d’ailleurs être des classes) ; la manche k reçoit la graine
+        `graine + k` (tirée au hasard si `graine` vaut None).
 
         Retourne un tuple (resultats, performance) :
             resultats   : {'IA-1': N, 'IA-2': M, 'nuls': D}
             performance : dict  (temps total, moyenne, nœuds évalués, …)
         """
-        # Compteurs initiaux
+        with ProcessPoolExecutor() as executeur:
+            futures = self.soumettre_parties(executeur, ia1, ia2, nb_parties, graine)
+            return self.bilan_match(ia1, ia2, [f.result() for f in futures])
+
+    def soumettre_parties(self, executeur, ia1, ia2, nb_parties, graine=None):
+        """Soumet les `nb_parties` manches d’un duel ; renvoie leurs futures.
+
+        ia1 / ia2 : instances ou directement classes d’IA."""
+        if graine is None:
+            graine = random.randrange(2 ** 32)
+        classe1 = ia1 if isinstance(ia1, type) else type(ia1)
+        classe2 = ia2 if isinstance(ia2, type) else type(ia2)
+        # Alterne qui commence en jouant 'X' pour éviter le biais
+        return [executeur.submit(_jouer_une_partie, graine + k, classe1, classe2, k % 2 == 1,
+                                 self.profil)
+                for k in range(nb_parties)]
+
+    def bilan_match(self, ia1, ia2, parties):
+        """Agrège les StatsPartie d’un duel en (resultats, performance).
+
+        `temps_total` est le temps écoulé entre le début de la première manche
+        et la fin de la dernière ; les manches tournant en parallèle, il est
+        plus court que `temps_calcul`, la somme des durées des parties."""
+        # --- Tableau des scores ---------------------------------------
         resultats = {ia1.nom: 0, ia2.nom: 0, 'nuls': 0}
-        total_coups_ia1 = total_coups_ia2 = 0
-        total_score_ia1 = total_score_ia2 = 0
-        move_count_ia1 = move_count_ia2 = 0
-        debut = time.time()
-
-        # -----------------------------------------------------------------
-        # Boucle principale sur chaque partie
-        # -----------------------------------------------------------------
-        for num_partie in range(nb_parties):
-            jeu = MorpionUltime()
-
-            # Alterne qui commence en jouant 'X' pour éviter le biais
-            if num_partie % 2 == 0:
-                joueurs = {'X': ia1, 'O': ia2}
-            else:
-                joueurs = {'X': ia2, 'O': ia1}
-
-            # Met à jour dynamiquement les symboles de chaque IA
-            for symbole, ia in joueurs.items():
-                ia.joueur = symbole
-                ia.adversaire = 'O' if symbole == 'X' else 'X'
-
-            # --- Boucle tour par tour -----------------------------------
-            while not jeu.jeu_termine:
-                ia_courante = joueurs[jeu.joueur_courant]
-                coup = ia_courante.get_move(jeu)    # IA choisit son action
-                if coup is None:                    # Sécurité (ne devrait pas arriver)
-                    break
-
-                # Comptabilise le nombre de positions examinées par l’IA
-                if ia_courante == ia1:
-                    total_coups_ia1 += ia_courante.coups_evalues
-                else:
-                    total_coups_ia2 += ia_courante.coups_evalues
-
-                # Comptabilise le score heuristique du coup choisi
-                sc = ia_courante.score_dernier_coup
-                if sc is not None:
-                    if ia_courante == ia1:
-                        total_score_ia1 += sc
-                        move_count_ia1 += 1
-                    else:
-                        total_score_ia2 += sc
-                        move_count_ia2 += 1
-
-                # Applique le coup sur la partie réelle
-                jeu.jouer_coup(*coup)
-
-            # --- Fin d’une partie : met à jour le tableau des scores -----
-            gagnant = jeu.obtenir_vainqueur()
-            if gagnant:
-                ia_gagnante = joueurs[gagnant]
-                resultats[ia_gagnante.nom] += 1
+        for partie in parties:
+            if partie.gagnant == 1:
+                resultats[ia1.nom] += 1
+            elif partie.gagnant == 2:
+                resultats[ia2.nom] += 1
             else:
                 resultats['nuls'] += 1
 
         # -----------------------------------------------------------------
         # Statistiques de performance globales
         # -----------------------------------------------------------------
-        temps_total = time.time() - debut
+        # Sommes colonne par colonne, en une passe (les champs gagnant et
+        # debut n’y ont pas de sens)
+        totaux          = StatsPartie(*map(sum, zip(*parties)))
+        nb_parties      = len(parties)
+        temps_total     = max(p.debut + p.temps for p in parties) - min(p.debut for p in parties)
+        temps_calcul    = totaux.temps
+        total_score_ia1 = totaux.score_ia1
+        total_score_ia2 = totaux.score_ia2
+        move_count_ia1  = totaux.nb_scores_ia1
+        move_count_ia2  = totaux.nb_scores_ia2
         perf = {
             'temps_total': temps_total,
-            'moyenne_par_partie': temps_total / nb_parties,
+            'temps_calcul': temps_calcul,
+            'moyenne_par_partie': temps_calcul / nb_parties,
             'ia1_score_total': total_score_ia1,
             'ia2_score_total': total_score_ia2,
             'ia1_score_moyen_par_coup': (total_score_ia1 / move_count_ia1) if move_count_ia1 else 0,
             'ia2_score_moyen_par_coup': (total_score_ia2 / move_count_ia2) if move_count_ia2 else 0,
         }
+        if self.profil:
+            perf['temps_par_ia_ns'] = {ia1.nom: totaux.ns_ia1, ia2.nom: totaux.ns_ia2}
 
         return resultats, perf
 
+    # -----------------------------------------------------------------
+    # Export des bilans (pour une analyse automatisée des tournois)
+    # -----------------------------------------------------------------
+    def sauvegarder(self, chemin):
+        """Écrit en JSON, sans arrondi, les bilans des duels déjà joués :
+        [{'duel', 'resultats', 'performance'}, …]."""
+        duels = [{'duel': duel, 'resultats': res, 'performance': self.stats_performance[duel]}
+                 for duel, res in self.resultats.items()]
+        with open(chemin, 'w', encoding='utf-8') as f:
+            json.dump(duels, f, ensure_ascii=False, indent=2)
+
     # -----------------------------------------------------------------
     # Enchaîne tous les duels possibles entre un ensemble d’IAs
     # -----------------------------------------------------------------
-    def tournoi_complet(self, nb_parties=10):
-        """Lance un tournoi “tous contre tous” entre IAFacile, IAMoyenne, IADifficile."""
-        # Liste des concurrents
-        ias = [
-            IAFacile('X'),
-            IAMoyenne('O'),
-            IADifficile('X')
-        ]
-
-        res_global = []
-
-        print(f"\n=== Lancement du tournoi avec {nb_parties} parties par duel ===\n")
-
-        # Double boucle pour parcourir toutes les paires (sans doublons)
-        for i in range(len(ias)):
-            for j in range(i + 1, len(ias)):
-                ia1, ia2 = ias[i], ias[j]
-
-                print(f"Match : {ia1.nom} vs {ia2.nom}")
-                res_duel, perf = self.lancer_match(ia1, ia2, nb_parties)
-
-                # Calculs de pourcentages pour affichage lisible
-                taux_ia1  = (res_duel[ia1.nom] / nb_parties) * 100
-                taux_ia2  = (res_duel[ia2.nom] / nb_parties) * 100
-                taux_nuls = (res_duel['nuls']   / nb_parties) * 100
-
-                # ---------------------- Affichage console -----------------
-                print("Résultats :")
-                print(f"  {ia1.nom} victoires : {res_duel[ia1.nom]} ({taux_ia1:.1f}%)")
-                print(f"  {ia2.nom} victoires : {res_duel[ia2.nom]} ({taux_ia2:.1f}%)")
-                print(f"  Nuls : {res_duel['nuls']} ({taux_nuls:.1f}%)")
-                print("Performance :")
-                print(f"  Temps total : {perf['temps_total']:.2f}s")
-                print(f"  Moyenne par partie : {perf['moyenne_par_partie']:.4f}s")
-                print(f"  {ia1.nom} score total : {perf['ia1_score_total']:.2f}")
-                print(f"  {ia2.nom} score total : {perf['ia2_score_total']:.2f}")
-                print(f"  {ia1.nom} score moyen par coup : {perf['ia1_score_moyen_par_coup']:.2f}")
-                print(f"  {ia2.nom} score moyen par coup : {perf['ia2_score_moyen_par_coup']:.2f}")
-                print()
-
-                # Stocke les infos pour un éventuel export/reporting
-                res_global.append({
+    def tournoi_complet(self, nb_parties=10, classes=CLASSES_IA):
+        """Lance un tournoi “tous contre tous” entre les classes d’IA `classes`
+        (par défaut IAFacile, IAMoyenne, IADifficile).
+
+        Générateur : produit le bilan de chaque duel dès qu’il est connu,
+        {'duel', 'ia1', 'ia2', 'resultats', 'performance'} (voir afficher_duel) ;
+        seuls ses chiffres restent dans resultats / stats_performance."""
+        # Un seul pool pour tout le tournoi : les parties de tous les duels
+        # sont soumises d’emblée, les bilans sont produits duel par duel
+        with ProcessPoolExecutor() as executeur:
+            # Toutes les paires (sans doublons), dans l’ordre de la liste
+            duels = [(ia1, ia2, self.soumettre_parties(executeur, ia1, ia2, nb_parties))
+                     for ia1, ia2 in combinations(classes, 2)]
+
+            for ia1, ia2, futures in duels:
+                res_duel, perf = self.bilan_match(ia1, ia2, [f.result() for f in futures])
+                del futures[:]                  # Les StatsPartie ne servent plus
+                self.resultats[f"{ia1.nom} vs {ia2.nom}"]         = res_duel
+                self.stats_performance[f"{ia1.nom} vs {ia2.nom}"] = perf
+                yield {
                     'duel': f"{ia1.nom} vs {ia2.nom}",
+                    'ia1': ia1.nom,
+                    'ia2': ia2.nom,
                     'resultats': res_duel,
                     'performance': perf
-                })
-
-        return res_global
+                }
+
+
+def afficher_duel(duel):
+    """Affiche le bilan d’un duel produit par Tournoi.tournoi_complet."""
+    nom1, nom2 = duel['ia1'], duel['ia2']
+    res_duel, perf = duel['resultats'], duel['performance']
+    nb_parties = sum(res_duel.values())
+
+    # Calculs de pourcentages pour affichage lisible
+    taux_ia1  = (res_duel[nom1] / nb_parties) * 100
+    taux_ia2  = (res_duel[nom2] / nb_parties) * 100
+    taux_nuls = (res_duel['nuls'] / nb_parties) * 100
+
+    # ---------------------- Affichage console -------------------------
+    # Rapport du duel composé en mémoire, puis écrit d’un bloc
+    buf = io.StringIO()
+    print(f"Match : {duel['duel']}", file=buf)
+    print("Résultats :", file=buf)
+    print(f"  {nom1} victoires : {res_duel[nom1]} ({taux_ia1:.1f}%)", file=buf)
+    print(f"  {nom2} victoires : {res_duel[nom2]} ({taux_ia2:.1f}%)", file=buf)
+    print(f"  Nuls : {res_duel['nuls']} ({taux_nuls:.1f}%)", file=buf)
+    print("Performance :", file=buf)
+    print(f"  Temps total : {perf['temps_total']:.2f}s", file=buf)
+    print(f"  Temps de calcul : {perf['temps_calcul']:.2f}s", file=buf)
+    print(f"  Moyenne par partie : {perf['moyenne_par_partie']:.4f}s", file=buf)
+    print(f"  {nom1} score total : {perf['ia1_score_total']:.2f}", file=buf)
+    print(f"  {nom2} score total : {perf['ia2_score_total']:.2f}", file=buf)
+    print(f"  {nom1} score moyen par coup : {perf['ia1_score_moyen_par_coup']:.2f}", file=buf)
+    print(f"  {nom2} score moyen par coup : {perf['ia2_score_moyen_par_coup']:.2f}", file=buf)
+    print(file=buf)
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
 
 
 # =============================================================================
 # Interface console basique — permet de tester le jeu et les IAs directement
 # =============================================================================
-def menu_principal():
-    """Affiche un menu texte pour démarrer des parties ou un tournoi."""
+def options_ligne_de_commande(argv=None):
+    """Options du programme : --json CHEMIN exporte les bilans des tournois."""
+    parser = argparse.ArgumentParser(description="Morpion Ultime & IA")
+    parser.add_argument('--json', metavar='CHEMIN', dest='chemin_json',
+                        help="fichier où enregistrer les résultats des tournois (JSON)")
+    return parser.parse_args(argv)
+
+
+def menu_principal(verbose=True, chemin_json=None):
+    """Affiche un menu texte pour démarrer des parties ou un tournoi.
+
+    `verbose` est transmis à humain_vs_ia (affichage entre les coups de l’IA) ;
+    si `chemin_json` est donné, chaque tournoi y est enregistré (Tournoi.sauvegarder)."""
     from game import humain_vs_humain, humain_vs_ia
     from ai import IAFacile, IAMoyenne, IADifficile
 
-    print("\n=== Projet Morpion Ultime & IA ===")
-    print("1. Humain vs Humain")
-    print("2. Humain vs IA Facile")
-    print("3. Humain vs IA Moyenne")
-    print("4. Humain vs IA Difficile")
-    print("5. Lancer un tournoi d'IA")
-    print("6. Quitter")
-
-    choix = input("Votre choix (1-6) : ")
-
-    # ------------------ Redirige selon le choix utilisateur ------------------
-    if choix == '1':
-        humain_vs_humain()
-    elif choix == '2':
-        humain_vs_ia(IAFacile('O'))
-    elif choix == '3':
-        humain_vs_ia(IAMoyenne('O'))
-    elif choix == '4':
-        humain_vs_ia(IADifficile('O'))
-    elif choix == '5':
-        parties = int(input("Nombre de parties par duel (défaut 10) : ") or 10)
-        tournoi = Tournoi()
-        tournoi.tournoi_complet(parties)
-    elif choix == '6':
-        print("Au revoir !")
-        return
-    else:
-        print("Choix invalide. Veuillez réessayer.")
-
-    # Après une partie ou un tournoi, propose de revenir au menu principal
-    if choix != '6':
+    # Boucle plutôt que récursion : la pile ne grandit pas d’une partie à l’autre
+    while True:
+        print("\n=== Projet Morpion Ultime & IA ===")
+        print("1. Humain vs Humain")
+        print("2. Humain vs IA Facile")
+        print("3. Humain vs IA Moyenne")
+        print("4. Humain vs IA Difficile")
+        print("5. Lancer un tournoi d'IA")
+        print("6. Quitter")
+
+        choix = input("Votre choix (1-6) : ")
+
+        # ------------------ Redirige selon le choix utilisateur --------------
+        if choix == '1':
+            humain_vs_humain()
+        elif choix == '2':
+            humain_vs_ia(IAFacile('O'), verbose)
+        elif choix == '3':
+            humain_vs_ia(IAMoyenne('O'), verbose)
+        elif choix == '4':
+            humain_vs_ia(IADifficile('O'), verbose)
+        elif choix == '5':
+            parties = int(input("Nombre de parties par duel (défaut 10) : ") or 10)
+            tournoi = Tournoi()
+            print(f"\n=== Lancement du tournoi avec {parties} parties par duel ===\n")
+            # Un fil dédié écrit les bilans (dans l’ordre) pendant que le
+            # processus principal agrège déjà le duel suivant
+            with ThreadPoolExecutor(max_workers=1) as sortie:
+                affichages = [sortie.submit(afficher_duel, duel)   # Affiché puis oublié
+                              for duel in tournoi.tournoi_complet(parties)]
+            for affichage in affichages:
+                affichage.result()                  # Remonte une éventuelle erreur d’affichage
+            if chemin_json:
+                tournoi.sauvegarder(chemin_json)
+                print(f"Résultats enregistrés dans {chemin_json}")
+        elif choix == '6':
+            print("Au revoir !")
+            return
+        else:
+            print("Choix invalide. Veuillez réessayer.")
+
+        # Après une partie ou un tournoi, propose de revenir au menu principal
         input("\nAppuyez sur Entrée pour revenir au menu...")
-        menu_principal()
 
 
 # Point d’entrée du script ----------------------------------------------------
 if __name__ == "__main__":
-    menu_principal()
+    menu_principal(chemin_json=options_ligne_de_commande().chemin_json)